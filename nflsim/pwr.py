@@ -1,4 +1,4 @@
-from .util import abbreviations, extractText
+from .util import abbreviations, extractText, hashFrame
 from requests import get
 from bs4 import BeautifulSoup
 from scipy import stats
@@ -114,6 +114,7 @@ class Sagarin(PWR):
 class PWRsystems(object):
     def __init__(self, regress_to=None, srs=None, fpi=None, dvoa=None, sagarin=None, others=None):
         self.regress_to = regress_to
+        self.cache = {}
         self.systems = []
         if (srs is None) and (fpi is None) and (dvoa is None) and (sagarin is None) and (others is None):
             self.systems.append(SRS())
@@ -136,19 +137,27 @@ class PWRsystems(object):
                         self.systems.append(system)
 
     def combine(self):
-        self.combined = self.systems[0].values[['Team']]
-        for system in self.systems:
-            self.combined = pd.merge(self.combined, system.values, on='Team', suffixes=('','_'))
-            self.combined = self.combined[[x for x in self.combined if x != 'Games Played_']]
-            new_z = stats.zscore(self.combined[system.pwrcol].values)
-            new_weights = [system.weight] * self.combined.shape[0]
-            if 'z_scores' not in self.combined:    
-                self.combined['z_scores'] = [[x] for x in new_z]
-                self.combined['weights'] = [[x] for x in new_weights]
-            else:
-                self.combined['z_scores'] = [x[0] + [x[1]] for x in list(zip(self.combined['z_scores'].values, new_z))]
-                self.combined['weights'] = [x[0] + [x[1]] for x in list(zip(self.combined['weights'].values, new_weights))]
-        zipped = zip(self.combined['z_scores'].values, self.combined['weights'].values)
-        self.combined['Avg_z'] = [np.inner(x, y) / np.sum(y) for x, y in zipped]
-        self.combined['PWR'] = self.combined['Avg_z'].values * 5
+        key = tuple((system.pwrcol, hashFrame(system.values)) for system in self.systems)
+        if key not in self.cache:
+            self.cache = {key:self.zscores()}
+        teams, games_played, z_scores = self.cache[key]
+        weights = np.array([system.weight for system in self.systems], dtype=float)
+        avg_z = z_scores.dot(weights) / np.sum(weights)
+        self.combined = pd.DataFrame({'Team':teams,'Avg_z':avg_z,'PWR':avg_z * 5,'Games Played':games_played})
         return PWR(regress_to=self.regress_to, values=self.combined[['Team','PWR','Games Played']]).calculate()
+
+    def zscores(self):
+        for system in self.systems:
+            if system.values['Team'].duplicated().any():
+                raise ValueError('Duplicate teams in ' + system.pwrcol + ' values')
+        teams = self.systems[0].values['Team']
+        for system in self.systems[1:]:
+            teams = teams[teams.isin(system.values['Team'].values)]
+        teams = teams.values
+        ratings = np.column_stack([system.values.set_index('Team')[system.pwrcol].reindex(teams).values
+                                   for system in self.systems])
+        played = next((system.values for system in self.systems if 'Games Played' in system.values), None)
+        if played is None:
+            raise KeyError('Games Played')
+        games_played = played.set_index('Team')['Games Played'].reindex(teams).values
+        return teams, games_played, stats.zscore(ratings, axis=0)
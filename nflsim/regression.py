@@ -8,24 +8,26 @@ class Regression(object):
         self.num_games = n_games
     
     def regress(self, df, pwrcol):
-        mydf = pd.DataFrame()
         if self.regression_values is None:
             self.regression_values = np.mean(df[pwrcol].values)
         if type(self.regression_values) is not pd.DataFrame:
-            reg_values = [self.regression_values] * df.shape[0]
-            mydf = df
+            reg_values = self.regression_values
         else:
-            merged = df.merge(self.regression_values, on='Team')
-            reg_values = merged['Baseline'].values
-            mydf = merged
+            baseline = self.regression_values
+            if baseline['Team'].duplicated().any():
+                raise ValueError('Duplicate teams in regression baseline')
+            missing = df.loc[~df['Team'].isin(baseline['Team'].values), 'Team']
+            if not missing.empty:
+                raise ValueError('No regression baseline for ' + ', '.join(missing.astype(str)))
+            reg_values = df['Team'].map(baseline.set_index('Team')['Baseline']).values
         if self.regression_weight is not None:
             reg_weight = self.regression_weight * df.shape[0]
             played_weight = (1 - self.regression_weight) * df.shape[0]
             weight_sum = 1
         else:
-            reg_weight = np.maximum(self.num_games - mydf['Games Played'].values, [0] * mydf.shape[0])
-            played_weight = mydf['Games Played'].values
+            played_weight = df['Games Played'].values
+            reg_weight = np.maximum(self.num_games - played_weight, 0)
             weight_sum = reg_weight + played_weight
-        played_weighted = mydf[pwrcol].values * played_weight
-        regressed_weighted =  reg_values * reg_weight
+        played_weighted = df[pwrcol].values * played_weight
+        regressed_weighted = reg_values * reg_weight
         return (played_weighted + regressed_weighted) / weight_sum
@@ -1,3 +1,5 @@
+import pandas as pd
+
 abbreviations = {
     'ARI':'Arizona Cardinals','ATL':'Atlanta Falcons','BAL':'Baltimore Ravens',
     'BUF':'Buffalo Bills','CAR':'Carolina Panthers','CHI':'Chicago Bears',
@@ -38,3 +40,6 @@ def extractHelper(tosearch, delim, reverse_order, is_optional, is_left):
     basefunc = str.rpartition if reverse_order else str.partition
     partitioned = basefunc(tosearch, delim)
     return partitioned[n] if (cond1 or partitioned[1] == delim) else partitioned[0] if cond2 else ''
+
+def hashFrame(df):
+    return (tuple(df), pd.util.hash_pandas_object(df, index=False).values.tobytes())